@@ -3,15 +3,27 @@
 Converts temp-contractors.csv directly to SQL INSERT statements for Bidrr.
 Validates and formats data, geocodes postal codes using OpenCage API, then outputs SQL ready for psql.
 Uses temp_* columns for proper temp account functionality.
+
+With --watch DIR, runs as a long-lived ingester: polls DIR for new or appended
+CSV files, converts only the rows added since the last pass, and writes each
+batch to its own SQL file (optionally loading it with psql). The geocode cache
+stays warm between files.
 """
 
+import argparse
 import csv
+import hashlib
+import io
 import sys
 import os
+import subprocess
+import tempfile
 import time
 import urllib.request
 import urllib.parse
 import json
+import re
+import shutil
 
 # Valid Bidrr services (must match exactly)
 VALID_SERVICES = [
@@ -84,6 +96,9 @@ VALID_SERVICES = [
     "Tile Installation", "Dog Run Installation"
 ]
 
+# Set view of VALID_SERVICES for constant-time membership checks
+VALID_SERVICES_SET = frozenset(VALID_SERVICES)
+
 def sql_escape(value):
     """Escape single quotes for SQL"""
     if value is None:
@@ -108,10 +123,10 @@ def parse_services(services_str):
         services = [services_str.strip()]
     
     # Filter to valid services only
-    valid = [s for s in services if s in VALID_SERVICES]
+    valid = [s for s in services if s in VALID_SERVICES_SET]
     
     if len(valid) < len(services):
-        invalid = [s for s in services if s not in VALID_SERVICES]
+        invalid = [s for s in services if s not in VALID_SERVICES_SET]
         print(f"-- Warning: Filtered out invalid services: {invalid}", file=sys.stderr)
     
     return valid
@@ -147,6 +162,12 @@ if not OPENCAGE_API_KEY:
 # Cache for geocoding results to avoid duplicate API calls
 geocode_cache = {}
 
+# Postal codes whose lookup failed (network/API error) -> time to try again.
+# Kept separate from geocode_cache so a brief outage does not stick for the
+# life of a long-running watch process.
+geocode_failures = {}
+GEOCODE_FAILURE_TTL = 300
+
 def geocode_postal_code(postal_code):
     """
     Geocode a Canadian postal code using OpenCage API (same as backend).
@@ -159,6 +180,8 @@ def geocode_postal_code(postal_code):
     # Check cache first
     if postal_code in geocode_cache:
         return geocode_cache[postal_code]
+    if geocode_failures.get(postal_code, 0) > time.monotonic():
+        return None, None
     
     max_retries = 3
     base_wait = 1
@@ -200,12 +223,12 @@ def geocode_postal_code(postal_code):
                 time.sleep(wait_time)
             else:
                 print(f"-- Failed after {max_retries} attempts", file=sys.stderr)
-                geocode_cache[postal_code] = (None, None)
+                geocode_failures[postal_code] = time.monotonic() + GEOCODE_FAILURE_TTL
                 return None, None
                 
         except Exception as e:
             print(f"-- Error geocoding {postal_code}: {str(e)}", file=sys.stderr)
-            geocode_cache[postal_code] = (None, None)
+            geocode_failures[postal_code] = time.monotonic() + GEOCODE_FAILURE_TTL
             return None, None
     
     return None, None
@@ -216,6 +239,64 @@ def format_coordinate(coord):
         return 'NULL'
     return str(coord)
 
+def render_contractor_sql(row, row_num, stats):
+    """
+    Render one CSV row as an INSERT statement.
+    Returns the SQL text, or None if the row fails validation.
+    Updates the inserted/errors/geocode_failures counters in stats.
+    """
+    # Required fields
+    email = (row.get('email') or '').strip().lower()
+    company_name = (row.get('company_name') or '').strip()
+    postal_code = format_postal_code((row.get('postal_code') or '').strip())
+    services = parse_services(row.get('services') or '')
+    
+    # Validation
+    if not email or not company_name or not postal_code or not services:
+        print(f"-- ERROR Row {row_num}: Missing required fields (email={bool(email)}, company={bool(company_name)}, postal={bool(postal_code)}, services={len(services)})", file=sys.stderr)
+        stats['errors'] += 1
+        return None
+    
+    # Geocode postal code
+    latitude, longitude = geocode_postal_code(postal_code)
+    
+    if latitude is None or longitude is None:
+        print(f"-- WARNING Row {row_num}: Failed to geocode {postal_code}, contractor may not receive mission notifications", file=sys.stderr)
+        stats['geocode_failures'] += 1
+    
+    # Format services as PostgreSQL array
+    services_array = format_services_array(services)
+    
+    lines = [f"-- Row {row_num}: {company_name}", "INSERT INTO users ("]
+    if latitude and longitude:
+        lines.append("    temp_email, temp_company_name, temp_postal_code, temp_services, role, radius_km, latitude, longitude, is_temp_account, temp_account_created_at")
+    else:
+        lines.append("    temp_email, temp_company_name, temp_postal_code, temp_services, role, radius_km, is_temp_account, temp_account_created_at")
+    lines.append(")")
+    lines.append("SELECT")
+    lines.append(f"    '{sql_escape(email)}',")
+    lines.append(f"    '{sql_escape(company_name)}',")
+    lines.append(f"    '{sql_escape(postal_code)}',")
+    lines.append(f"    {services_array},")
+    lines.append(f"    'contractor',")
+    lines.append(f"    50,")
+    if latitude and longitude:
+        lines.append(f"    {latitude},")
+        lines.append(f"    {longitude},")
+    lines.append(f"    TRUE,")
+    lines.append(f"    NOW()")
+    # Skip contractors that already have a temp account, so re-running a file
+    # (or a watch-mode re-ingest) cannot create duplicates
+    lines.append(f"WHERE NOT EXISTS (SELECT 1 FROM users WHERE temp_email = '{sql_escape(email)}');")
+    lines.append("")
+    
+    stats['inserted'] += 1
+    return "\n".join(lines)
+
+def new_stats():
+    """Fresh counters for render_contractor_sql"""
+    return {'inserted': 0, 'errors': 0, 'geocode_failures': 0}
+
 def generate_sql(csv_path):
     """Generate SQL INSERT statements from CSV"""
     
@@ -227,9 +308,7 @@ def generate_sql(csv_path):
     print("BEGIN;")
     print()
     
-    inserted_count = 0
-    error_count = 0
-    geocode_fail_count = 0
+    stats = new_stats()
     
     try:
         with open(csv_path, 'r', encoding='utf-8') as csvfile:
@@ -237,64 +316,23 @@ def generate_sql(csv_path):
             
             for row_num, row in enumerate(reader, start=2):
                 try:
-                    # Required fields
-                    email = row.get('email', '').strip().lower()
-                    company_name = row.get('company_name', '').strip()
-                    postal_code = format_postal_code(row.get('postal_code', '').strip())
-                    services = parse_services(row.get('services', ''))
-                    
-                    # Validation
-                    if not email or not company_name or not postal_code or not services:
-                        print(f"-- ERROR Row {row_num}: Missing required fields (email={bool(email)}, company={bool(company_name)}, postal={bool(postal_code)}, services={len(services)})", file=sys.stderr)
-                        error_count += 1
-                        continue
-                    
-                    # Geocode postal code
-                    latitude, longitude = geocode_postal_code(postal_code)
-                    
-                    if latitude is None or longitude is None:
-                        print(f"-- WARNING Row {row_num}: Failed to geocode {postal_code}, contractor may not receive mission notifications", file=sys.stderr)
-                        geocode_fail_count += 1
-                    
-                    # Format services as PostgreSQL array
-                    services_array = format_services_array(services)
-                    
-                    print(f"-- Row {row_num}: {company_name}")
-                    print("INSERT INTO users (")
-                    if latitude and longitude:
-                        print("    temp_email, temp_company_name, temp_postal_code, temp_services, role, radius_km, latitude, longitude, is_temp_account, temp_account_created_at")
-                    else:
-                        print("    temp_email, temp_company_name, temp_postal_code, temp_services, role, radius_km, is_temp_account, temp_account_created_at")
-                    print(") VALUES (")
-                    print(f"    '{sql_escape(email)}',")
-                    print(f"    '{sql_escape(company_name)}',")
-                    print(f"    '{sql_escape(postal_code)}',")
-                    print(f"    {services_array},")
-                    print(f"    'contractor',")
-                    print(f"    50,")
-                    if latitude and longitude:
-                        print(f"    {latitude},")
-                        print(f"    {longitude},")
-                    print(f"    TRUE,")
-                    print(f"    NOW()")
-                    print(");")
-                    print()
-                    
-                    inserted_count += 1
+                    sql = render_contractor_sql(row, row_num, stats)
+                    if sql:
+                        print(sql)
                     
                 except Exception as e:
                     print(f"-- ERROR Row {row_num}: {str(e)}", file=sys.stderr)
-                    error_count += 1
+                    stats['errors'] += 1
         
         print("COMMIT;")
         print()
-        print(f"-- Summary: {inserted_count} contractors prepared for insert")
+        print(f"-- Summary: {stats['inserted']} contractors prepared for insert")
         
-        if geocode_fail_count > 0:
-            print(f"-- Warning: {geocode_fail_count} contractors could not be geocoded", file=sys.stderr)
+        if stats['geocode_failures'] > 0:
+            print(f"-- Warning: {stats['geocode_failures']} contractors could not be geocoded", file=sys.stderr)
         
-        if error_count > 0:
-            print(f"-- Errors: {error_count} rows skipped due to validation errors", file=sys.stderr)
+        if stats['errors'] > 0:
+            print(f"-- Errors: {stats['errors']} rows skipped due to validation errors", file=sys.stderr)
         
     except FileNotFoundError:
         print(f"-- ERROR: File not found: {csv_path}", file=sys.stderr)
@@ -303,11 +341,420 @@ def generate_sql(csv_path):
         print(f"-- ERROR: {str(e)}", file=sys.stderr)
         sys.exit(1)
 
-if __name__ == "__main__":
-    csv_path = os.path.expanduser("~/Desktop/temp-contractors.csv")
+# ---------------------------------------------------------------------------
+# Watch mode
+# ---------------------------------------------------------------------------
+
+STATE_FILENAME = '.ingest-state.json'
+
+# Bytes hashed from each end of the already-consumed part of a file
+FINGERPRINT_BYTES = 4096
+
+# An unfinished trailing record (no final newline, e.g. Google Sheets exports)
+# is treated as complete once the file's size and mtime have not changed for
+# this many passes
+QUIET_PASSES = 2
+
+# psql load retries: wait RETRY_BASE_SECONDS, doubling up to RETRY_MAX_SECONDS,
+# and move the batch to failed/ after MAX_LOAD_ATTEMPTS
+MAX_LOAD_ATTEMPTS = 5
+RETRY_BASE_SECONDS = 5
+RETRY_MAX_SECONDS = 300
+
+# A psql load that takes longer than this counts as a failed attempt
+PSQL_TIMEOUT_SECONDS = 120
+
+def write_atomic(path, text):
+    """Write text to path via a temp file + rename so readers never see a partial file"""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.tmp-', suffix='.part')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+def load_state(out_dir):
+    """Load per-file read offsets (keyed by CSV file name) saved by a previous watch session"""
+    try:
+        with open(os.path.join(out_dir, STATE_FILENAME), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+def save_state(out_dir, state):
+    write_atomic(os.path.join(out_dir, STATE_FILENAME), json.dumps(state, indent=2))
+
+def consumed_fingerprint(f, offset):
+    """Hash the first and last FINGERPRINT_BYTES of f[:offset] to detect in-place rewrites"""
+    digest = hashlib.sha256()
+    f.seek(0)
+    digest.update(f.read(min(offset, FINGERPRINT_BYTES)))
+    tail_start = max(0, offset - FINGERPRINT_BYTES)
+    f.seek(tail_start)
+    digest.update(f.read(offset - tail_start))
+    return digest.hexdigest()
+
+CSV_SPECIAL = re.compile(rb'[",\n]')
+
+def complete_records_end(chunk):
+    """
+    Return the length of the longest prefix of chunk made of complete CSV records,
+    i.e. the position just after the last newline that is not inside a quoted field.
+    Like csv.reader, a quote only opens a quoted field at the start of the field,
+    so values such as 12" Tile Co are plain text. chunk must start at a record boundary.
+    """
+    in_quotes = False
+    field_start = 0
+    end = 0
+    pos = 0
     
-    if len(sys.argv) > 1:
-        csv_path = sys.argv[1]
+    while True:
+        match = CSV_SPECIAL.search(chunk, pos)
+        if not match:
+            break
+        i = match.start()
+        char = match.group()
+        pos = i + 1
+        
+        if in_quotes:
+            if char == b'"':
+                if chunk[i + 1:i + 2] == b'"':
+                    # Escaped "" inside a quoted field
+                    pos = i + 2
+                else:
+                    in_quotes = False
+        elif char == b'"':
+            if i == field_start:
+                in_quotes = True
+        else:
+            field_start = i + 1
+            if char == b'\n':
+                end = i + 1
+    
+    return end
+
+def read_new_rows(csv_path, file_state):
+    """
+    Read the complete rows appended to csv_path since file_state was recorded.
+    Returns (rows, new_file_state) where rows is a list of (row_num, dict).
+    A trailing record that is not finished yet (no newline, or an open quoted
+    field) is left for the next pass, so files that are still being written
+    are picked up once the record is complete. If the file stays unchanged for
+    QUIET_PASSES passes, the trailing record is taken as it is.
+    """
+    try:
+        f = open(csv_path, 'rb')
+    except FileNotFoundError:
+        # Removed between listdir and open
+        return [], file_state
     
-    print(f"-- Reading CSV from: {csv_path}", file=sys.stderr)
-    generate_sql(csv_path)
+    with f:
+        st = os.fstat(f.fileno())
+        offset = file_state.get('offset', 0)
+        
+        # Start over if the part already consumed no longer matches: the file was
+        # truncated or rewritten with different content. A file that was replaced
+        # (new inode, e.g. an editor saving via temp file + rename) but still starts
+        # with the same bytes is treated as an append.
+        changed = (file_state.get('inode') != st.st_ino
+                   or file_state.get('mtime_ns') != st.st_mtime_ns)
+        if (st.st_size < offset
+                or (changed and consumed_fingerprint(f, offset) != file_state.get('fingerprint'))):
+            file_state = {
+                'inode': st.st_ino,
+                'mtime_ns': None,
+                'offset': 0,
+                'fingerprint': consumed_fingerprint(f, 0),
+                'row_num': 1,
+                'header': None,
+            }
+            offset = 0
+        
+        if st.st_size == offset:
+            return [], dict(file_state, mtime_ns=st.st_mtime_ns)
+        
+        f.seek(offset)
+        chunk = f.read(st.st_size - offset)
+        
+        end = complete_records_end(chunk)
+        
+        # Count the passes the unfinished tail has sat unchanged
+        tail_seen = [st.st_size, st.st_mtime_ns]
+        quiet_passes = 0
+        if end < len(chunk):
+            if file_state.get('tail_seen') == tail_seen:
+                quiet_passes = file_state.get('quiet_passes', 0) + 1
+            if quiet_passes >= QUIET_PASSES:
+                end = len(chunk)
+        
+        if end == 0:
+            return [], dict(file_state, tail_seen=tail_seen, quiet_passes=quiet_passes)
+        tail_state = {'tail_seen': tail_seen, 'quiet_passes': quiet_passes} if end < len(chunk) else {}
+        chunk = chunk[:end]
+        new_offset = offset + len(chunk)
+        
+        encoding = 'utf-8-sig' if offset == 0 else 'utf-8'
+        records = list(csv.reader(io.StringIO(chunk.decode(encoding), newline='')))
+        
+        header = file_state['header']
+        row_num = file_state['row_num']
+        rows = []
+        
+        for values in records:
+            if not values:
+                continue
+            if header is None:
+                header = [h.strip() for h in values]
+                continue
+            row_num += 1
+            rows.append((row_num, dict(zip(header, values))))
+        
+        new_state = {
+            'inode': st.st_ino,
+            'mtime_ns': st.st_mtime_ns,
+            'offset': new_offset,
+            'fingerprint': consumed_fingerprint(f, new_offset),
+            'row_num': row_num,
+            'header': header,
+            **tail_state,
+        }
+    return rows, new_state
+
+def build_batch_sql(csv_path, rows, stats):
+    """Render a batch of rows as one transaction; returns None if no row is valid"""
+    statements = []
+    
+    for row_num, row in rows:
+        try:
+            sql = render_contractor_sql(row, row_num, stats)
+            if sql:
+                statements.append(sql)
+        except Exception as e:
+            print(f"-- ERROR Row {row_num}: {str(e)}", file=sys.stderr)
+            stats['errors'] += 1
+    
+    if not statements:
+        return None
+    
+    header = [
+        "-- Bulk Insert Temp Contractors for Bidrr",
+        f"-- Generated from: {os.path.basename(csv_path)} (rows {rows[0][0]}-{rows[-1][0]})",
+        "-- Using OpenCage API for geocoding",
+        "-- Using temp_* columns for proper temp account functionality",
+        "",
+        "BEGIN;",
+        "",
+    ]
+    footer = [
+        "COMMIT;",
+        "",
+        f"-- Summary: {len(statements)} contractors prepared for insert",
+        "",
+    ]
+    return "\n".join(header + statements + footer)
+
+def load_with_psql(sql_path, database_url):
+    """Run a batch file through psql; the batch's BEGIN/COMMIT rolls back on any error"""
+    try:
+        result = subprocess.run(
+            ['psql', database_url, '-X', '-q', '-v', 'ON_ERROR_STOP=1', '-f', sql_path],
+            capture_output=True,
+            text=True,
+            timeout=PSQL_TIMEOUT_SECONDS,
+        )
+    except subprocess.TimeoutExpired:
+        print(f"-- ERROR: psql timed out after {PSQL_TIMEOUT_SECONDS}s for {sql_path}", file=sys.stderr)
+        return False
+    except OSError as e:
+        print(f"-- ERROR: Could not run psql for {sql_path}: {str(e)}", file=sys.stderr)
+        return False
+    if result.returncode != 0:
+        print(f"-- ERROR: psql failed for {sql_path}: {result.stderr.strip()}", file=sys.stderr)
+        return False
+    return True
+
+def load_pending(key, state, out_dir, database_url):
+    """
+    Try to load the batch waiting in state[key]['pending'].
+    On success the batch moves into out_dir and the file's offset advances.
+    On failure the next attempt is scheduled with exponential backoff; after
+    MAX_LOAD_ATTEMPTS the batch is moved to out_dir/failed/ and the offset
+    advances anyway so later rows in the file are not blocked behind it.
+    """
+    pending = state[key]['pending']
+    if time.time() < pending['retry_at']:
+        return
+    
+    sql_name = pending['sql_name']
+    pending_path = os.path.join(out_dir, 'pending', sql_name)
+    
+    if not os.path.exists(pending_path):
+        # Drop the batch and re-read its rows from the old offset; the INSERTs
+        # skip existing temp accounts, so nothing is duplicated
+        print(f"-- ERROR: Pending batch {sql_name} is missing, re-reading its rows", file=sys.stderr)
+        state[key] = {k: v for k, v in state[key].items() if k != 'pending'}
+        save_state(out_dir, state)
+        return
+    
+    if load_with_psql(pending_path, database_url):
+        os.replace(pending_path, os.path.join(out_dir, sql_name))
+        print(f"-- Loaded {sql_name}", file=sys.stderr)
+        state[key] = pending['next_state']
+    else:
+        attempts = pending['attempts'] + 1
+        if attempts >= MAX_LOAD_ATTEMPTS:
+            failed_dir = os.path.join(out_dir, 'failed')
+            os.makedirs(failed_dir, exist_ok=True)
+            os.replace(pending_path, os.path.join(failed_dir, sql_name))
+            print(f"-- ERROR: Giving up on {sql_name} after {attempts} attempts, moved to {failed_dir}", file=sys.stderr)
+            state[key] = pending['next_state']
+        else:
+            wait_time = min(RETRY_BASE_SECONDS * (2 ** (attempts - 1)), RETRY_MAX_SECONDS)
+            print(f"-- Retrying {sql_name} in {wait_time} seconds (attempt {attempts + 1}/{MAX_LOAD_ATTEMPTS})", file=sys.stderr)
+            state[key] = dict(state[key], pending=dict(pending, attempts=attempts, retry_at=time.time() + wait_time))
+    
+    save_state(out_dir, state)
+
+def process_file(csv_path, state, out_dir, database_url):
+    """
+    Convert and (optionally) load the rows appended to one CSV.
+    The new offset is saved to disk as soon as the batch is written/loaded,
+    so an interrupt later in the pass cannot cause the batch to be re-inserted.
+    """
+    # Keyed by file name so the state does not depend on the working directory
+    # the watcher was started from
+    key = os.path.basename(csv_path)
+    
+    # Rows after a batch that has not loaded yet wait until it is resolved
+    if 'pending' in state.get(key, {}):
+        load_pending(key, state, out_dir, database_url)
+        return
+    
+    rows, new_file_state = read_new_rows(csv_path, state.get(key, {}))
+    
+    if not rows:
+        if new_file_state != state.get(key):
+            state[key] = new_file_state
+            save_state(out_dir, state)
+        return
+    
+    started = time.monotonic()
+    stats = new_stats()
+    sql = build_batch_sql(csv_path, rows, stats)
+    
+    if stats['geocode_failures'] > 0:
+        print(f"-- Warning: {stats['geocode_failures']} contractors could not be geocoded", file=sys.stderr)
+    if stats['errors'] > 0:
+        print(f"-- Errors: {stats['errors']} rows skipped due to validation errors", file=sys.stderr)
+    print(f"-- Processed {len(rows)} rows in {time.monotonic() - started:.1f}s", file=sys.stderr)
+    
+    if not sql:
+        state[key] = new_file_state
+        save_state(out_dir, state)
+        return
+    
+    stem = os.path.splitext(os.path.basename(csv_path))[0]
+    sql_name = f"{time.strftime('%Y%m%d-%H%M%S')}-{stem}-rows{rows[0][0]}-{rows[-1][0]}.sql"
+    print(f"-- {os.path.basename(csv_path)}: {stats['inserted']} contractors -> {sql_name}", file=sys.stderr)
+    
+    if not database_url:
+        write_atomic(os.path.join(out_dir, sql_name), sql)
+        state[key] = new_file_state
+        save_state(out_dir, state)
+        return
+    
+    # Stage the batch under pending/ so a failed load is retried from the
+    # rendered file instead of re-validating and re-geocoding the rows
+    pending_dir = os.path.join(out_dir, 'pending')
+    os.makedirs(pending_dir, exist_ok=True)
+    write_atomic(os.path.join(pending_dir, sql_name), sql)
+    state[key] = dict(state.get(key, {}), pending={
+        'sql_name': sql_name,
+        'attempts': 0,
+        'retry_at': 0,
+        'next_state': new_file_state,
+    })
+    load_pending(key, state, out_dir, database_url)
+
+def watch(watch_dir, out_dir, database_url, interval):
+    """Poll watch_dir for new or appended CSV files until interrupted"""
+    if not os.path.isdir(watch_dir):
+        print(f"-- ERROR: Watch directory not found: {watch_dir}", file=sys.stderr)
+        sys.exit(1)
+    
+    os.makedirs(out_dir, exist_ok=True)
+    state = load_state(out_dir)
+    
+    print(f"-- Watching {watch_dir} for CSV files (every {interval}s)", file=sys.stderr)
+    print(f"-- Writing SQL batches to {out_dir}", file=sys.stderr)
+    if database_url:
+        print("-- Loading each batch with psql", file=sys.stderr)
+    
+    # File name -> (inode, mtime_ns, message) of the last error reported for it,
+    # so an error that repeats every pass is only printed again once the file changes
+    reported_errors = {}
+    listing_failed = False
+    
+    try:
+        while True:
+            try:
+                names = sorted(os.listdir(watch_dir))
+                listing_failed = False
+            except OSError as e:
+                if not listing_failed:
+                    print(f"-- ERROR: Cannot read watch directory {watch_dir}: {str(e)} (waiting for it to come back)", file=sys.stderr)
+                    listing_failed = True
+                names = []
+            
+            for name in names:
+                if not name.lower().endswith('.csv'):
+                    continue
+                csv_path = os.path.join(watch_dir, name)
+                try:
+                    process_file(csv_path, state, out_dir, database_url)
+                    reported_errors.pop(name, None)
+                except Exception as e:
+                    try:
+                        st = os.stat(csv_path)
+                        error_key = (st.st_ino, st.st_mtime_ns, str(e))
+                    except OSError:
+                        error_key = (None, None, str(e))
+                    if reported_errors.get(name) != error_key:
+                        print(f"-- ERROR: {name}: {str(e)} (not repeated until the file changes)", file=sys.stderr)
+                        reported_errors[name] = error_key
+            
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        print("-- Stopped watching", file=sys.stderr)
+    finally:
+        save_state(out_dir, state)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Convert temp contractor CSVs to SQL INSERT statements.")
+    parser.add_argument('csv_path', nargs='?', default=os.path.expanduser("~/Desktop/temp-contractors.csv"),
+                        help="CSV file to convert (default: ~/Desktop/temp-contractors.csv)")
+    parser.add_argument('--watch', metavar='DIR',
+                        help="Keep running and ingest new or appended CSV files dropped into DIR")
+    parser.add_argument('--out', metavar='DIR',
+                        help="Where watch mode writes SQL batches (default: DIR/sql)")
+    parser.add_argument('--psql', metavar='DATABASE_URL',
+                        help="In watch mode, load each batch with psql as a single transaction")
+    parser.add_argument('--interval', type=float, default=2.0,
+                        help="Seconds between directory scans in watch mode (default: 2)")
+    args = parser.parse_args()
+    
+    if args.watch:
+        if args.psql and not shutil.which('psql'):
+            print("-- ERROR: --psql was given but psql is not on PATH", file=sys.stderr)
+            sys.exit(1)
+        out_dir = args.out or os.path.join(args.watch, 'sql')
+        watch(args.watch, out_dir, args.psql, args.interval)
+    else:
+        print(f"-- Reading CSV from: {args.csv_path}", file=sys.stderr)
+        generate_sql(args.csv_path)